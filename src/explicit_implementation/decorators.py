@@ -8,9 +8,10 @@ _R = TypeVar("_R")
 
 def implements(interface_method: Callable[Concatenate[Any, _P], _R]):
     def mark_implementation(
-        implementation_method: Callable[Concatenate[_T, _P], _R]
+        implementation_method: Callable[Concatenate[_T, _P], _R],
+        _interface_method: Callable[Concatenate[Any, _P], _R] = interface_method,
     ) -> Callable[Concatenate[_T, _P], _R]:
-        implementation_method.__explicit_implementation_for__ = interface_method
+        implementation_method.__explicit_implementation_for__ = _interface_method
         
         return implementation_method
     
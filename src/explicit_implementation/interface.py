@@ -1,38 +1,51 @@
 from abc import ABCMeta
-from typing import Callable, Dict, FrozenSet, Type, TypeVar, cast
+from types import FunctionType
+from typing import Callable, Dict, FrozenSet, Tuple, Type, TypeVar, cast
 
 
 ImplementationMapping = Dict[Callable, Callable]
+ImplementationTable = Tuple[Tuple[Callable, ...], Tuple[Callable, ...]]
 T = TypeVar('T', bound='Interface')
 
 
-class InterfaceMeta(ABCMeta):
-    __explicit__implementations__: Dict[Type['Interface'], ImplementationMapping]
-    __explicit__specifications__: FrozenSet[Callable]
+_FORWARDING_METHOD_CODE = compile(
+    "def forward(self, *args, **kwargs):\n"
+    "    return _implementation(self._instance, *args, **kwargs)\n",
+    "<explicit-implementation>",
+    "exec",
+)
 
-    def __new__(mcs, name, bases, namespace, *, concrete: bool = False):
-        inherited_specifications = []
-        for base in bases:
-            if not issubclass(base, Interface):
-                continue
 
-            inherited_specifications.extend(base.__explicit__specifications__)
+def _forwarding_method(name: str, implementation: Callable) -> Callable:
+    namespace: Dict[str, Callable] = {}
+    exec(_FORWARDING_METHOD_CODE, {"__name__": implementation.__module__, "_implementation": implementation}, namespace)
 
-        defined_specifications = []
-        for attr_name, attr_value in namespace.items():
-            if not callable(attr_value) or not getattr(attr_value, "__isabstractmethod__", False):
-                continue
+    forward = namespace["forward"]
+    forward.__name__ = forward.__qualname__ = name
+    forward.__doc__ = implementation.__doc__
+    forward.__wrapped__ = implementation
+    return forward
 
-            defined_specifications.append(attr_value)
 
-        inherited_specifications.extend(defined_specifications)
-        inherited_specifications = set(inherited_specifications)
+# Names defined by the generated view class or inherited from object. Specifications
+# with these names are not placed on the view, so the view's own attribute shadows
+# them and their implementations cannot be reached through the view.
+_VIEW_RESERVED_NAMES = frozenset(dir(object)) | {"__slots__", "__module__", "__qualname__", "__getattr__", "_instance"}
 
+
+class InterfaceMeta(ABCMeta):
+    __explicit__implementations__: Dict[Type['Interface'], ImplementationTable]
+    __explicit__specifications__: FrozenSet[Callable]
+    __explicit__spec_by_name__: Dict[str, Callable]
+    __interface_factories__: Dict[Type['Interface'], Callable]
+
+    def __new__(mcs, name, bases, namespace, *, concrete: bool = False):
+        inherited_specifications: set[Callable] = set()
         inherited_implementations: Dict[Type['Interface'], ImplementationMapping] = {}
-        multiple_overrides: list[Callable] = []
-        for base in bases:
-            if not issubclass(base, Interface):
-                continue
+        conflicts: set[Callable] = set()
+        interface_bases = [base for base in bases if type(base) is InterfaceMeta or isinstance(base, InterfaceMeta)]
+        for base in interface_bases:
+            inherited_specifications.update(base.__explicit__specifications__)
 
             try:
                 explicit_implementations = base.__explicit__implementations__
@@ -46,31 +59,40 @@ class InterfaceMeta(ABCMeta):
                 if interface not in inherited_implementations:
                     inherited_implementations[interface] = {}
 
-                for specification, implementation in implementations.items():
-                    if implementation in multiple_overrides:
-                        continue
+                inherited_mapping = inherited_implementations[interface]
+                for specification, implementation in zip(*implementations):
+                    existing = inherited_mapping.get(specification)
+                    if existing is not None and existing is not implementation:
+                        conflicts.add(specification)
+
+                    inherited_mapping[specification] = implementation
+
+        defined_specifications: Dict[str, Callable] = {}
+        for attr_name, attr_value in namespace.items():
+            if type(attr_value) is FunctionType:
+                if not attr_value.__dict__.get("__isabstractmethod__", False):
+                    continue
+            elif not callable(attr_value) or not getattr(attr_value, "__isabstractmethod__", False):
+                continue
 
-                    if implementation in inherited_implementations[interface]:
-                        multiple_overrides.append(implementation)
+            defined_specifications[attr_name] = attr_value
 
-                    inherited_implementations[interface][specification] = implementation
+        inherited_specifications.update(defined_specifications.values())
 
         values_to_remove = []
         for attr_name, attr_value in namespace.items():
             if not callable(attr_value):
                 continue
 
-            try:
-                explicit_implementation_for = attr_value.__explicit_implementation_for__
-            except AttributeError:
+            explicit_implementation_for = getattr(attr_value, "__explicit_implementation_for__", None)
+            if explicit_implementation_for is None:
                 continue
 
-            declaring_interface = explicit_implementation_for.__declaring_interface__
+            if explicit_implementation_for not in inherited_specifications and explicit_implementation_for not in conflicts:
+                raise TypeError(f"Method '{attr_name}' is marked as an explicit implementation for method '{explicit_implementation_for.__name__}', which is not an abstract method of any base interface of '{name}'")
 
-            try:
-                inherited_specifications.remove(explicit_implementation_for)
-            except (KeyError, ValueError):
-                raise TypeError(f"Method '{attr_name}' is marked as an explicit implementation for method '{explicit_implementation_for.__name__}', which is not an abstract method of any base interface of '{name}'") from None
+            inherited_specifications.discard(explicit_implementation_for)
+            declaring_interface = explicit_implementation_for.__declaring_interface__
             
             try:
                 explicit_implementations = inherited_implementations[declaring_interface]
@@ -78,36 +100,63 @@ class InterfaceMeta(ABCMeta):
                 explicit_implementations = inherited_implementations[declaring_interface] = {}
 
             explicit_implementations[explicit_implementation_for] = attr_value
-            if explicit_implementation_for in multiple_overrides:
-                multiple_overrides.remove(explicit_implementation_for)
+            conflicts.discard(explicit_implementation_for)
             values_to_remove.append(attr_name)
 
-        if multiple_overrides:
-            method_names = ", ".join(f"'{m.__name__}'" for m in multiple_overrides)
-            raise TypeError(f"Methods {method_names} are marked as explicit implementations for methods of multiple base interfaces of '{name}'")
+        if conflicts:
+            method_names = ", ".join(sorted(f"'{m.__name__}'" for m in conflicts))
+            raise TypeError(f"Methods {method_names} have conflicting explicit implementations inherited from multiple bases of '{name}'")
 
         for attr_name in values_to_remove:
             del namespace[attr_name]
 
         cls = super().__new__(mcs, name, bases, namespace)
 
-        for specification in defined_specifications:
+        for specification in defined_specifications.values():
             specification.__declaring_interface__ = cls
 
         if concrete and inherited_specifications:
             raise TypeError(f"Concrete class '{name}' does not provide explicit implementations for all abstract methods: {', '.join(m.__name__ for m in inherited_specifications)}")
 
-        cls.__explicit__specifications__ = frozenset(inherited_specifications)
-        cls.__explicit__implementations__ = inherited_implementations
+        spec_names = set(defined_specifications)
+        for base in interface_bases:
+            spec_names.update(base.__explicit__spec_by_name__)
 
-        try:
-            cls.__abstractmethods__ = frozenset(map(lambda m: m.__name__, cls.__explicit__specifications__))
-        except AttributeError:
+        spec_by_name: Dict[str, Callable] = {}
+        for spec_name in spec_names:
+            specification = getattr(cls, spec_name, None)
+            if hasattr(specification, "__declaring_interface__"):
+                spec_by_name[spec_name] = specification
+
+        cls.__explicit__specifications__ = frozenset(inherited_specifications)
+        cls.__explicit__spec_by_name__ = spec_by_name
+        cls.__explicit__implementations__ = {
+            interface: (tuple(implementations.keys()), tuple(implementations.values()))
+            for interface, implementations in inherited_implementations.items()
+        }
+        cls.__interface_factories__ = {}
+
+        if not inherited_specifications:
             cls.__abstractmethods__ = frozenset()
 
+            for interface in inherited_implementations:
+                cls.as_interface_type(interface)
+        else:
+            cls.__abstractmethods__ = frozenset(specification.__name__ for specification in inherited_specifications)
+
         return cls
     
     def as_interface_type(cls, interface: Type[T]) -> Callable[[T], T]:
+        try:
+            return cls.__interface_factories__[interface]
+        except (KeyError, TypeError):
+            pass
+
+        factory = cls._create_interface_type(interface)
+        cls.__interface_factories__[interface] = factory
+        return factory
+
+    def _create_interface_type(cls, interface: Type[T]) -> Callable[[T], T]:
         if not isinstance(interface, type) or not issubclass(interface, Interface):
             raise TypeError(f"Expected an interface type, got {interface}")
         
@@ -117,32 +166,58 @@ class InterfaceMeta(ABCMeta):
         if not interface.__explicit__specifications__:
             return lambda instance: cast(T, instance)
             
-        if interface not in cls.__explicit__implementations__:
-            raise TypeError(f"Class {cls.__name__} does not implement interface {interface.__name__}")
+        try:
+            specifications, implementations = cls.__explicit__implementations__[interface]
+        except KeyError:
+            raise TypeError(f"Class {cls.__name__} does not implement interface {interface.__name__}") from None
+
+        spec_by_name = interface.__explicit__spec_by_name__
+        implementation_by_spec = dict(zip(specifications, implementations))
+
+        def __init__(self, instance: T):
+            object.__setattr__(self, "_instance", instance)
 
-        implementation_mapping = cls.__explicit__implementations__[interface]
-
-        class ExplicitImplementation:
-            def __init__(self, instance: T):
-                self._instance = instance
-
-            def __getattr__(self, name):
-                try:
-                    specification = getattr(interface, name)
-                except AttributeError as e:
-                    raise e from None
-                
-                if hasattr(specification, "__declaring_interface__"):
-                    try:
-                        return implementation_mapping[specification].__get__(self._instance)
-                    except KeyError:
-                        raise TypeError(f"Class {cls.__name__} does not provide an explicit implementation for method '{name}' of interface {interface.__name__}") from None
-                
-                return getattr(self._instance, name)
+        def __getattr__(self, name):
+            specification = spec_by_name.get(name)
+            if specification is not None:
+                implementation = implementation_by_spec.get(specification)
+                if implementation is None:
+                    raise TypeError(f"Class {cls.__name__} does not provide an explicit implementation for method '{name}' of interface {interface.__name__}")
+
+                return implementation.__get__(self._instance)
+
+            try:
+                getattr(interface, name)
+            except AttributeError as e:
+                raise e from None
+
+            return getattr(self._instance, name)
+
+        attrs = {}
+        for specification, implementation in zip(specifications, implementations):
+            attr_name = specification.__name__
+            if attr_name in _VIEW_RESERVED_NAMES or spec_by_name.get(attr_name) is not specification:
+                continue
+
+            if type(implementation) is FunctionType:
+                attrs[attr_name] = _forwarding_method(attr_name, implementation)
+
+        ExplicitImplementation = type(f"{cls.__name__}As{interface.__name__}", (), {
+            "__slots__": ("_instance",),
+            "__init__": __init__,
+            "__getattr__": __getattr__,
+            **attrs,
+        })
 
         return cast(Callable[[T], T], ExplicitImplementation)
 
 
 class Interface(metaclass=InterfaceMeta):
     def as_interface(self, interface: Type[T]) -> T:
-        return type(self).as_interface_type(interface)(cast(T, self))
+        cls = type(self)
+        try:
+            factory = cls.__interface_factories__[interface]
+        except (KeyError, TypeError):
+            factory = cls.as_interface_type(interface)
+
+        return factory(cast(T, self))
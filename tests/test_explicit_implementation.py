@@ -1,3 +1,5 @@
+import inspect
+
 import pytest
 from explicit_implementation import Interface, abstractmethod, implements
 
@@ -157,6 +159,15 @@ class TestImplementationErrors:
                 def foo_impl2(self, x: int) -> str:
                     return str(x)
     
+    def test_implementing_concrete_method(self):
+        """Test that marking a non-abstract interface method as implemented raises TypeError."""
+
+        with pytest.raises(TypeError, match="which is not an abstract method"):
+            class Concrete(IWithConcreteMethod):
+                @implements(IWithConcreteMethod.concrete_method)
+                def concrete_method_impl(self) -> str:
+                    return "impl"
+
     def test_accessing_unimplemented_interface(self):
         """Test accessing an interface that wasn't implemented."""
         
@@ -233,6 +244,134 @@ class TestInterfaceAccess:
         assert foo1.foo(1) == "first: 1"
         assert foo2.foo(2) == "second: 2"
 
+    def test_interface_type_is_cached_per_class(self):
+        """Test that the interface view factory is built once per class and interface."""
+
+        class Concrete(IFoo):
+            @implements(IFoo.foo)
+            def foo_implementation(self, x: int) -> str:
+                return str(x)
+
+        class Derived(Concrete):
+            pass
+
+        assert Concrete.as_interface_type(IFoo) is Concrete.as_interface_type(IFoo)
+        assert Derived.as_interface_type(IFoo) is not Concrete.as_interface_type(IFoo)
+        assert Derived().as_interface(IFoo).foo(3) == "3"
+
+    def test_interface_types_built_at_class_creation(self):
+        """Test that fully implemented classes build their interface views eagerly."""
+
+        class Concrete(IFoo, IBar):
+            @implements(IFoo.foo)
+            def foo_implementation(self, x: int) -> str:
+                return str(x)
+
+            @implements(IBar.bar)
+            def bar_implementation(self, y: int) -> bool:
+                return y > 0
+
+        class Partial(IFoo, IBar):
+            @implements(IFoo.foo)
+            def foo_implementation(self, x: int) -> str:
+                return str(x)
+
+        assert set(Concrete.__interface_factories__) == {IFoo, IBar}
+        assert Partial.__interface_factories__ == {}
+
+    def test_specification_names_colliding_with_view_internals(self):
+        """Test that specifications named like the view's own attributes are not exposed and do not break the view."""
+
+        class ICollide(Interface):
+            @abstractmethod
+            def _instance(self) -> str:
+                ...
+
+            @abstractmethod
+            def __getattr__(self, name: str) -> str:
+                ...
+
+            @abstractmethod
+            def __setattr__(self, name: str, value: object) -> None:
+                ...
+
+            @abstractmethod
+            def value(self) -> int:
+                ...
+
+        class Concrete(ICollide):
+            @implements(ICollide._instance)
+            def instance_impl(self) -> str:
+                return "instance"
+
+            @implements(ICollide.__getattr__)
+            def getattr_impl(self, name: str) -> str:
+                return name
+
+            @implements(ICollide.__setattr__)
+            def setattr_impl(self, name: str, value: object) -> None:
+                pass
+
+            @implements(ICollide.value)
+            def value_impl(self) -> int:
+                return 7
+
+        concrete = Concrete()
+        view = concrete.as_interface(ICollide)
+
+        view_type = type(view)
+
+        # Reserved names keep the view's own attributes; their implementations are not exposed.
+        assert view.value() == 7
+        assert view_type.__setattr__ is object.__setattr__
+        assert not callable(view_type.__dict__['_instance'])
+
+    def test_forwarding_method_metadata(self):
+        """Test that view methods carry the specification name and the implementation's metadata."""
+
+        class Concrete(IFoo):
+            @implements(IFoo.foo)
+            def foo_implementation(self, x: int) -> str:
+                """Implementation docstring."""
+                return str(x)
+
+        foo_impl = Concrete().as_interface(IFoo)
+        forward = type(foo_impl).__dict__['foo']
+
+        assert forward.__name__ == 'foo'
+        assert forward.__doc__ == "Implementation docstring."
+        assert forward.__module__ == __name__
+        assert str(inspect.signature(foo_impl.foo)) == "(x: int) -> str"
+
+    def test_staticmethod_implementation(self):
+        """Test that non-function implementations are bound through the descriptor protocol."""
+
+        class Concrete(IFoo):
+            @implements(IFoo.foo)
+            @staticmethod
+            def foo_implementation(x: int) -> str:
+                return f"static: {x}"
+
+        foo_impl = Concrete().as_interface(IFoo)
+
+        assert 'foo' not in type(foo_impl).__dict__
+        assert foo_impl.foo(1) == "static: 1"
+
+    def test_interface_view_has_no_instance_dict(self):
+        """Test that interface views are slotted and only hold the wrapped instance."""
+
+        class Concrete(IFoo):
+            @implements(IFoo.foo)
+            def foo_implementation(self, x: int) -> str:
+                return str(x)
+
+        concrete = Concrete()
+        foo_impl = concrete.as_interface(IFoo)
+
+        with pytest.raises(AttributeError):
+            object.__getattribute__(foo_impl, '__dict__')
+        assert foo_impl._instance is concrete
+
 
 class TestMultipleInheritance:
     """Test complex inheritance scenarios."""
@@ -301,6 +440,79 @@ class TestMultipleInheritance:
         with pytest.raises(TypeError, match="does not provide an explicit implementation for method 'base_method'"):
             right_impl.base_method()
     
+    def test_shared_implementation_through_multiple_bases(self):
+        """Test that inheriting the same implementation through several bases is not a conflict."""
+
+        class Base(IFoo):
+            @implements(IFoo.foo)
+            def foo_implementation(self, x: int) -> str:
+                return f"base: {x}"
+
+        class Left(Base):
+            pass
+
+        class Right(Base):
+            pass
+
+        class Concrete(Left, Right):
+            pass
+
+        assert Concrete().as_interface(IFoo).foo(1) == "base: 1"
+
+    def test_conflicting_implementations_from_multiple_bases(self):
+        """Test that different implementations of the same method from multiple bases raise TypeError."""
+
+        class Left(IFoo):
+            @implements(IFoo.foo)
+            def foo_left(self, x: int) -> str:
+                return "left"
+
+        class Right(IFoo):
+            @implements(IFoo.foo)
+            def foo_right(self, x: int) -> str:
+                return "right"
+
+        with pytest.raises(TypeError, match="conflicting explicit implementations"):
+            class Concrete(Left, Right):
+                pass
+
+    def test_resolving_conflicting_implementations(self):
+        """Test that a class can resolve conflicting inherited implementations by implementing the method itself."""
+
+        class Left(IFoo):
+            @implements(IFoo.foo)
+            def foo_left(self, x: int) -> str:
+                return "left"
+
+        class Right(IFoo):
+            @implements(IFoo.foo)
+            def foo_right(self, x: int) -> str:
+                return "right"
+
+        class Concrete(Left, Right):
+            @implements(IFoo.foo)
+            def foo_resolved(self, x: int) -> str:
+                return "resolved"
+
+        assert Concrete().as_interface(IFoo).foo(1) == "resolved"
+
+    def test_marker_interface_without_own_implementations(self):
+        """Test that an interface whose methods are implemented for its base does not expose stubs."""
+
+        class IMarker(IFoo):
+            pass
+
+        class Concrete(IMarker):
+            @implements(IFoo.foo)
+            def foo_implementation(self, x: int) -> str:
+                return str(x)
+
+        concrete = Concrete()
+        assert concrete.as_interface(IFoo).foo(1) == "1"
+
+        with pytest.raises(TypeError, match="does not provide an explicit implementation for method 'foo'"):
+            concrete.as_interface(IMarker).foo(1)
+
     def test_partial_implementation_allowed_by_default(self):
         """Test that partial implementations are allowed by default at class definition time."""
         